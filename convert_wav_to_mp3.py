@@ -26,52 +26,38 @@ WAV 파일을 MP3로 변환하는 Raycast 스크립트
 import os
 import sys
 import subprocess
+import threading
 import time
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import finder_selection
+import tool_paths
+
+# 여러 변환 스레드의 출력이 섞이지 않도록 하는 잠금
+_print_lock = threading.Lock()
+
+# 한 ffmpeg 프로세스가 변환하는 파일 수 (프로세스 생성 비용 분산용)
+BATCH_SIZE = 16
 
 def check_ffmpeg_installed():
     """
     FFmpeg가 설치되어 있는지 확인합니다.
-    
+    경로 탐색 결과는 캐시되어 다음 실행부터는 프로세스 생성 없이 확인됩니다.
+
     Returns:
         bool: FFmpeg 설치 여부
     """
-    try:
-        result = subprocess.run(['which', 'ffmpeg'], 
-                               stdout=subprocess.PIPE, 
-                               stderr=subprocess.PIPE,
-                               text=True)
-        return result.returncode == 0
-    except Exception:
-        return False
+    return tool_paths.cached_which('ffmpeg') is not None
 
 def get_finder_selection():
     """
     Finder에서 현재 선택된 파일/폴더의 경로를 가져옵니다.
-    
+
     Returns:
         list: 선택된 파일/폴더 경로 목록
     """
-    script = '''
-    osascript -e 'tell application "Finder"
-        set selectedItems to selection as alias list
-        set pathList to {}
-        repeat with i from 1 to count of selectedItems
-            set selectedItem to item i of selectedItems
-            set pathList to pathList & (POSIX path of selectedItem)
-        end repeat
-        return pathList
-    end tell'
-    '''
-    
-    try:
-        result = subprocess.run(script, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        if result.returncode == 0 and result.stdout.strip():
-            paths = result.stdout.strip().split(", ")
-            return [path.strip() for path in paths if path.strip()]
-        return []
-    except Exception:
-        return []
+    return finder_selection.get_finder_selection()
 
 def open_file_dialog(file_types=None):
     """
@@ -104,30 +90,34 @@ def open_file_dialog(file_types=None):
     except Exception:
         return None
 
+# normalize_path는 디렉토리 크롤 시 수천 번 호출되므로
+# 속성 조회를 모듈 로드 시 한 번으로 줄임
+_nfc = unicodedata.normalize
+_expanduser = os.path.expanduser
+_isabs = os.path.isabs
+_abspath = os.path.abspath
+
 def normalize_path(path):
     """
     입력된 경로를 정규화하고 절대 경로로 변환합니다.
-    
+
     Args:
         path (str): 변환할 파일 경로
-    
+
     Returns:
         str: 정규화된 절대 경로
     """
-    # 유니코드 정규화
-    path = unicodedata.normalize('NFC', path)
-    
-    # 경로가 따옴표로 감싸진 경우 제거
-    path = path.strip('"\'')
-    
+    # 유니코드 정규화 후 감싼 따옴표 제거
+    path = _nfc('NFC', path).strip('"\'')
+
     # 사용자 홈 디렉토리 (~) 확장
     if path.startswith('~'):
-        path = os.path.expanduser(path)
-    
+        path = _expanduser(path)
+
     # 상대 경로를 절대 경로로 변환
-    if not os.path.isabs(path):
-        path = os.path.abspath(path)
-    
+    if not _isabs(path):
+        path = _abspath(path)
+
     return path
 
 def convert_wav_to_mp3(wav_path, bitrate='192k'):
@@ -143,9 +133,11 @@ def convert_wav_to_mp3(wav_path, bitrate='192k'):
     """
     # 경로 정규화
     wav_path = normalize_path(wav_path)
-    
-    # 파일 존재 여부 확인
-    if not os.path.exists(wav_path):
+
+    # 존재 확인과 크기 조회를 stat 한 번으로 처리
+    try:
+        wav_size = os.stat(wav_path).st_size / (1024 * 1024)  # MB 단위
+    except FileNotFoundError:
         raise FileNotFoundError(f"파일을 찾을 수 없습니다: {wav_path}")
     
     # 입력 파일이 WAV 형식인지 확인
@@ -156,16 +148,19 @@ def convert_wav_to_mp3(wav_path, bitrate='192k'):
     mp3_path = os.path.splitext(wav_path)[0] + '.mp3'
     
     # FFmpeg 명령 구성
+    # -threads 0: 인코더가 사용 가능한 코어를 모두 쓰도록 위임
     command = [
         'ffmpeg',
         '-i', wav_path,
         '-codec:a', 'libmp3lame',
         '-b:a', bitrate,
+        '-threads', '0',
         '-y',  # 기존 파일 덮어쓰기
         mp3_path
     ]
     
-    print(f"변환 중: {os.path.basename(wav_path)} -> {os.path.basename(mp3_path)}")
+    with _print_lock:
+        print(f"변환 중: {os.path.basename(wav_path)} -> {os.path.basename(mp3_path)}")
     
     # FFmpeg 실행
     start_time = time.time()
@@ -179,24 +174,83 @@ def convert_wav_to_mp3(wav_path, bitrate='192k'):
     if process.returncode != 0:
         raise RuntimeError(f"변환 실패: {process.stderr}")
     
-    # 결과 확인
-    if not os.path.exists(mp3_path):
+    # 결과 확인 (존재 확인과 크기 조회를 한 번에)
+    try:
+        mp3_size = os.stat(mp3_path).st_size / (1024 * 1024)  # MB 단위
+    except FileNotFoundError:
         raise RuntimeError("MP3 파일이 생성되지 않았습니다.")
-    
+
     duration = end_time - start_time
     
-    # 파일 크기 정보
-    wav_size = os.path.getsize(wav_path) / (1024 * 1024)  # MB 단위
-    mp3_size = os.path.getsize(mp3_path) / (1024 * 1024)  # MB 단위
-    
-    print(f"변환 완료: {os.path.basename(mp3_path)}")
-    print(f"소요 시간: {duration:.2f}초")
-    print(f"WAV 크기: {wav_size:.2f} MB")
-    print(f"MP3 크기: {mp3_size:.2f} MB")
-    print(f"압축률: {(1 - mp3_size/wav_size) * 100:.2f}%")
+    with _print_lock:
+        print(f"변환 완료: {os.path.basename(mp3_path)}")
+        print(f"소요 시간: {duration:.2f}초")
+        print(f"WAV 크기: {wav_size:.2f} MB")
+        print(f"MP3 크기: {mp3_size:.2f} MB")
+        print(f"압축률: {(1 - mp3_size/wav_size) * 100:.2f}%")
     
     return mp3_path
 
+def convert_wav_batch(wav_paths, bitrate='192k'):
+    """
+    여러 WAV 파일을 ffmpeg 한 번의 실행으로 MP3로 변환합니다.
+
+    프로세스 생성과 코덱 초기화 비용(파일당 수십 ms)을 배치 전체에
+    분산시켜 짧은 파일이 많은 경우 처리량이 크게 높아집니다.
+
+    Args:
+        wav_paths (list): WAV 파일 경로 목록
+        bitrate (str): MP3 비트레이트 (기본값: 192k)
+
+    Returns:
+        list: 생성된 MP3 파일 경로 목록
+    """
+    norm_paths = []
+    for path in wav_paths:
+        path = normalize_path(path)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+        if not path.lower().endswith('.wav'):
+            raise ValueError(f"입력 파일이 WAV 형식이 아닙니다: {path}")
+        norm_paths.append(path)
+
+    # 입력 전부를 -i로 나열하고 출력마다 -map으로 대응시킴
+    command = ['ffmpeg', '-y']
+    for path in norm_paths:
+        command += ['-i', path]
+
+    mp3_paths = []
+    for idx, path in enumerate(norm_paths):
+        mp3_path = os.path.splitext(path)[0] + '.mp3'
+        command += ['-map', f'{idx}:a',
+                    '-codec:a', 'libmp3lame',
+                    '-b:a', bitrate,
+                    '-threads', '0',
+                    mp3_path]
+        mp3_paths.append(mp3_path)
+
+    with _print_lock:
+        print(f"배치 변환 중: {len(norm_paths)}개 파일 (단일 ffmpeg 프로세스)")
+
+    start_time = time.time()
+    process = subprocess.run(command,
+                             stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE,
+                             text=True)
+    duration = time.time() - start_time
+
+    if process.returncode != 0:
+        raise RuntimeError(f"배치 변환 실패: {process.stderr}")
+
+    missing = [p for p in mp3_paths if not os.path.exists(p)]
+    if missing:
+        raise RuntimeError(f"MP3 파일이 생성되지 않았습니다: {missing}")
+
+    with _print_lock:
+        print(f"배치 변환 완료: {len(mp3_paths)}개 파일, {duration:.2f}초")
+
+    return mp3_paths
+
 def get_wav_files_from_directory(directory_path):
     """
     디렉토리에서 모든 WAV 파일을 찾습니다.
@@ -210,14 +264,32 @@ def get_wav_files_from_directory(directory_path):
     directory_path = normalize_path(directory_path)
     if not os.path.isdir(directory_path):
         raise ValueError(f"유효한 디렉토리가 아닙니다: {directory_path}")
-    
-    wav_files = []
-    for root, dirs, files in os.walk(directory_path):
-        for file in files:
-            if file.lower().endswith('.wav'):
-                wav_files.append(os.path.join(root, file))
-    
-    return wav_files
+
+    # os.scandir의 DirEntry는 디렉토리 읽기에서 얻은 메타데이터를 재사용하므로
+    # 파일마다 별도의 stat 호출 없이 타입 판별이 가능함
+    def _walk(d):
+        with os.scandir(d) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _walk(entry.path)
+                elif entry.name.lower().endswith('.wav'):
+                    yield entry.path
+
+    return list(_walk(directory_path))
+
+def get_jobs_from_args():
+    """
+    --jobs 인자에서 동시 변환 작업 수를 읽습니다.
+
+    Returns:
+        int: 동시 작업 수 (기본값: CPU 코어 수)
+    """
+    if '--jobs' in sys.argv:
+        try:
+            return max(1, int(sys.argv[sys.argv.index('--jobs') + 1]))
+        except (IndexError, ValueError):
+            pass
+    return os.cpu_count() or 1
 
 def main():
     # FFmpeg 설치 확인
@@ -233,24 +305,24 @@ def main():
         # Finder에서 선택된 항목이 있는 경우
         print(f"Finder에서 {len(selected_paths)}개 항목이 선택되었습니다.")
         
-        # WAV 파일과 디렉토리 분류
-        wav_files = []
+        # 한 번의 패스로 정규화와 분류를 수행하고, 결과를 set에 담아
+        # 이후 별도의 중복 제거 패스를 없앰 (경로는 이미 정규화된 키)
+        wav_files = set()
         directories = []
-        
-        for path in selected_paths:
-            norm_path = normalize_path(path)
+
+        for norm_path in map(normalize_path, selected_paths):
             if os.path.isdir(norm_path):
                 directories.append(norm_path)
             elif norm_path.lower().endswith('.wav'):
-                wav_files.append(norm_path)
-        
+                wav_files.add(norm_path)
+
         # 디렉토리에서 WAV 파일 추가
         for directory in directories:
             try:
                 dir_wav_files = get_wav_files_from_directory(directory)
                 if dir_wav_files:
                     print(f"디렉토리 '{os.path.basename(directory)}'에서 {len(dir_wav_files)}개의 WAV 파일을 찾았습니다.")
-                    wav_files.extend(dir_wav_files)
+                    wav_files.update(dir_wav_files)
                 else:
                     print(f"디렉토리 '{os.path.basename(directory)}'에 WAV 파일이 없습니다.")
             except Exception as e:
@@ -274,8 +346,8 @@ def main():
             sys.exit(0)
         wav_files = [wav_path]
     
-    # 중복 제거 및 정렬
-    wav_files = sorted(list(set(wav_files)))
+    # 정렬 (중복은 수집 단계에서 이미 제거됨)
+    wav_files = sorted(wav_files)
     
     try:
         # 파일 변환
@@ -284,23 +356,51 @@ def main():
             mp3_path = convert_wav_to_mp3(wav_files[0])
             print(f"\nMP3 파일이 성공적으로 생성되었습니다: {mp3_path}")
         else:
-            print(f"\n총 {len(wav_files)}개의 WAV 파일 변환 시작...")
-            
+            # 파일들을 배치로 묶어 ffmpeg 프로세스 생성 비용을 분산시키고,
+            # 배치 단위로 스레드 풀에서 동시에 실행
+            jobs = get_jobs_from_args()
+            batches = [wav_files[i:i + BATCH_SIZE]
+                       for i in range(0, len(wav_files), BATCH_SIZE)]
+            print(f"\n총 {len(wav_files)}개의 WAV 파일 변환 시작... "
+                  f"(배치 {len(batches)}개, 동시 작업: {jobs})")
+
             # 진행 상황 표시를 위한 카운터
             success_count = 0
             error_count = 0
             errors = []
-            
-            for i, wav_file in enumerate(wav_files, 1):
+            completed = 0
+
+            def convert_batch_with_fallback(batch):
+                """배치 변환을 시도하고, 실패하면 파일별로 재시도합니다."""
                 try:
-                    print(f"\n[{i}/{len(wav_files)}] 변환 중...")
-                    mp3_path = convert_wav_to_mp3(wav_file)
-                    success_count += 1
-                except Exception as e:
-                    error_count += 1
-                    errors.append((wav_file, str(e)))
-                    print(f"오류: {e}", file=sys.stderr)
-            
+                    convert_wav_batch(batch)
+                    return [(f, None) for f in batch]
+                except Exception:
+                    results = []
+                    for f in batch:
+                        try:
+                            convert_wav_to_mp3(f)
+                            results.append((f, None))
+                        except Exception as e:
+                            results.append((f, str(e)))
+                    return results
+
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = [executor.submit(convert_batch_with_fallback, b)
+                           for b in batches]
+                for future in as_completed(futures):
+                    for wav_file, error in future.result():
+                        completed += 1
+                        if error is None:
+                            success_count += 1
+                            with _print_lock:
+                                print(f"[{completed}/{len(wav_files)}] 완료: {os.path.basename(wav_file)}")
+                        else:
+                            error_count += 1
+                            errors.append((wav_file, error))
+                            with _print_lock:
+                                print(f"오류: {error}", file=sys.stderr)
+
             # 최종 결과 요약
             print("\n=== 변환 결과 요약 ===")
             print(f"총 파일 수: {len(wav_files)}")
@@ -1,23 +1,47 @@
-import pandas as pd
 import json
 import os
 
+# 읽기 경로는 pandas 없이 처리: python-calamine이 있으면 가장 빠르고,
+# 없으면 openpyxl read_only 모드로 행 단위 스트리밍
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+def _read_excel_rows(excel_file):
+    """엑셀 첫 번째 시트를 (헤더, 행 목록)으로 읽어 반환"""
+    if CalamineWorkbook is not None:
+        rows = CalamineWorkbook.from_path(excel_file).get_sheet_by_index(0).to_python()
+    else:
+        from openpyxl import load_workbook
+        wb = load_workbook(excel_file, read_only=True, data_only=True)
+        try:
+            rows = [list(row) for row in wb.active.iter_rows(values_only=True)]
+        finally:
+            wb.close()
+    if not rows:
+        return [], []
+    return rows[0], rows[1:]
+
 def json_to_excel(json_file='questions.json', excel_file='questions.xlsx'):
     """JSON 파일을 엑셀 형식으로 변환하여 저장"""
     try:
+        # 쓰기 경로에서만 pandas를 사용하므로 여기서 지연 임포트
+        import pandas as pd
+
         # JSON 파일 읽기
         with open(json_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
-        
+
         questions = data['raycast_questions']
-        
+
         # DataFrame 생성
         df = pd.DataFrame(questions)
-        
+
         # 엑셀 파일로 저장
         df.to_excel(excel_file, index=False, engine='openpyxl')
         print(f"✅ JSON 데이터가 {excel_file}로 저장되었습니다.")
-        
+
     except FileNotFoundError:
         print(f"❌ {json_file} 파일을 찾을 수 없습니다.")
     except Exception as e:
@@ -26,21 +50,19 @@ def json_to_excel(json_file='questions.json', excel_file='questions.xlsx'):
 def excel_to_json(excel_file='questions.xlsx', json_file='questions_from_excel.json'):
     """엑셀 파일을 JSON 형식으로 변환하여 저장"""
     try:
-        # 엑셀 파일 읽기
-        df = pd.read_excel(excel_file, engine='openpyxl')
-        
-        # DataFrame을 딕셔너리 리스트로 변환
-        questions = df.to_dict('records')
-        
+        # 엑셀 파일 읽기 (행 단위 스트리밍, DataFrame 중간 복사 없음)
+        headers, rows = _read_excel_rows(excel_file)
+        questions = [dict(zip(headers, row)) for row in rows]
+
         # JSON 구조 생성
         data = {'raycast_questions': questions}
-        
+
         # JSON 파일로 저장
         with open(json_file, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
-        
+
         print(f"✅ 엑셀 데이터가 {json_file}로 저장되었습니다.")
-        
+
     except FileNotFoundError:
         print(f"❌ {excel_file} 파일을 찾을 수 없습니다.")
     except Exception as e:
@@ -49,8 +71,8 @@ def excel_to_json(excel_file='questions.xlsx', json_file='questions_from_excel.j
 def load_questions_from_excel(excel_file='questions.xlsx'):
     """엑셀 파일에서 문제 데이터를 직접 로드"""
     try:
-        df = pd.read_excel(excel_file, engine='openpyxl')
-        questions = df.to_dict('records')
+        headers, rows = _read_excel_rows(excel_file)
+        questions = [dict(zip(headers, row)) for row in rows]
         return questions
     except FileNotFoundError:
         print(f"❌ {excel_file} 파일을 찾을 수 없습니다.")
@@ -63,12 +85,12 @@ if __name__ == '__main__':
     # 사용 예시
     print("1. JSON → Excel 변환")
     json_to_excel()
-    
+
     print("\n2. Excel → JSON 변환")
     excel_to_json()
-    
+
     print("\n3. Excel에서 직접 데이터 로드")
     questions = load_questions_from_excel()
     if questions:
         print(f"✅ {len(questions)}개의 문제를 로드했습니다.")
-        print(f"첫 번째 문제: {questions[0]['title']}")
\ No newline at end of file
+        print(f"첫 번째 문제: {questions[0]['title']}")
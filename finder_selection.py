@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Finder 선택 항목을 가져오는 공용 헬퍼
+특징: osascript를 한 번만 호출하고 경로 사이를 NUL(ASCII 0)로 구분하여
+쉼표나 개행이 포함된 파일 이름도 안전하게 처리합니다.
+"""
+
+import subprocess
+
+# NUL은 파일 경로에 나타날 수 없으므로 구분자로 안전함
+_APPLE_SCRIPT = '''
+tell application "Finder"
+    set selectedItems to selection as alias list
+    set pathList to {}
+    repeat with i from 1 to count of selectedItems
+        set end of pathList to POSIX path of item i of selectedItems
+    end repeat
+    set AppleScript's text item delimiters to (ASCII character 0)
+    return pathList as string
+end tell
+'''
+
+def get_finder_selection():
+    """
+    Finder에서 현재 선택된 파일/폴더의 경로 목록을 가져옵니다.
+
+    Returns:
+        list: 선택된 파일/폴더 경로 목록 (선택이 없거나 실패 시 빈 리스트)
+    """
+    try:
+        result = subprocess.run(['osascript', '-e', _APPLE_SCRIPT],
+                                capture_output=True, text=True)
+        if result.returncode == 0 and result.stdout:
+            return [p for p in result.stdout.strip('\n').split('\x00') if p]
+        return []
+    except Exception:
+        return []
@@ -35,45 +35,30 @@ PDF 파일을 최적화하는 Raycast 스크립트
 
 import subprocess
 import os
+import threading
 from pathlib import Path
 import sys
-import shutil
 import tempfile
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import finder_selection
+import tool_paths
+
+# 파일명 정리용 패턴을 모듈 로드 시 한 번만 컴파일
+_SANITIZE_RE = re.compile(r'[^\w\-\. ]')
 
 def get_selected_files_from_finder():
     """
     AppleScript를 사용하여 현재 Finder에서 선택된 파일 목록을 가져옵니다.
     개선된 버전: 다양한 특수문자를 포함한 파일 이름을 처리합니다.
     """
-    apple_script = '''
-    tell application "Finder"
-        set sel_items to selection as alias list
-        set output_text to ""
-        repeat with i in sel_items
-            set file_path to POSIX path of i
-            set output_text to output_text & file_path & "\\n"
-        end repeat
-        return output_text
-    end tell
-    '''
-    
-    try:
-        result = subprocess.run(['osascript', '-e', apple_script], 
-                               capture_output=True, text=True, check=True)
-        
-        # 개행문자로 구분된 파일 경로를 리스트로 변환
-        file_paths = [path.strip() for path in result.stdout.strip().split('\n') if path.strip()]
-        return file_paths
-    except subprocess.CalledProcessError as e:
-        print(f"AppleScript 실행 중 오류 발생: {e}")
-        if hasattr(e, 'stderr') and e.stderr:
-            print(f"오류 내용: {e.stderr}")
-        return []
+    return finder_selection.get_finder_selection()
 
 def check_ghostscript_installation():
     """
     Ghostscript가 설치되어 있는지 확인하고, 경로를 반환합니다.
+    경로 탐색 결과는 캐시되어 다음 실행부터는 stat 한 번으로 확인됩니다.
     """
     # 가능한 Ghostscript 실행 파일 경로들
     possible_paths = [
@@ -83,12 +68,11 @@ def check_ghostscript_installation():
         '/usr/bin/gs',  # 일부 리눅스 시스템
         '/opt/local/bin/gs',  # MacPorts
     ]
-    
-    # 각 경로 확인
-    for path in possible_paths:
-        if shutil.which(path):
-            return path
-    
+
+    path = tool_paths.cached_which('gs', possible_paths)
+    if path:
+        return path
+
     # 설치되지 않은 경우 안내 메시지 출력
     print("❌ Ghostscript(gs)가 설치되어 있지 않습니다.")
     print("Homebrew를 사용하여 설치하려면 터미널에서 다음 명령을 실행하세요:")
@@ -101,8 +85,7 @@ def sanitize_filename(filename):
     파일 이름에서 시스템에 문제를 일으킬 수 있는 특수 문자를 제거합니다.
     """
     # 허용할 문자들: 영숫자, 점, 하이픈, 언더스코어, 공백
-    sanitized = re.sub(r'[^\w\-\. ]', '_', filename)
-    return sanitized
+    return _SANITIZE_RE.sub('_', filename)
 
 def optimize_pdf(input_path: str, output_path: str, gs_path: str):
     """
@@ -110,8 +93,11 @@ def optimize_pdf(input_path: str, output_path: str, gs_path: str):
     """
     input_file = Path(input_path).expanduser()
     output_file = Path(output_path).expanduser()
-    
-    if not input_file.exists():
+
+    # 존재 확인과 크기 조회를 stat 한 번으로 처리 (네트워크 볼륨에서 유의미)
+    try:
+        original_size = os.stat(input_file).st_size
+    except FileNotFoundError:
         raise FileNotFoundError(f"입력 PDF를 찾을 수 없습니다: {input_file}")
     
     # 출력 디렉토리가 없으면 생성
@@ -132,17 +118,36 @@ def optimize_pdf(input_path: str, output_path: str, gs_path: str):
         "-dColorImageResolution=150",              # 이미지 DPI 조정
         "-dAutoFilterColorImages=false",
         "-dColorImageFilter=/DCTEncode",           # JPEG 압축
-        "-sOutputFile=" + str(output_file),
+        "-sOutputFile=-",                          # stdout으로 스트리밍
         str(input_file)
     ]
-    
+
     try:
-        result = subprocess.run(gs_command, check=True, capture_output=True)
-        
+        # gs 출력을 파이프로 받아 직접 파일에 기록하면서 바이트 수를 세면
+        # 결과 크기를 알기 위해 os.path.getsize를 다시 호출할 필요가 없음
+        optimized_size = 0
+        with subprocess.Popen(gs_command,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE) as proc:
+            # stderr를 별도 스레드로 비워 둔다 - 경고가 파이프 버퍼를 채우면
+            # gs가 stderr 쓰기에서 멈추고 stdout 루프도 같이 교착된다
+            stderr_chunks = []
+            drain = threading.Thread(
+                target=lambda: stderr_chunks.append(proc.stderr.read()),
+                daemon=True)
+            drain.start()
+            with open(output_file, 'wb') as out:
+                for chunk in iter(lambda: proc.stdout.read(1024 * 1024), b''):
+                    out.write(chunk)
+                    optimized_size += len(chunk)
+            drain.join()
+            stderr = stderr_chunks[0] if stderr_chunks else b''
+
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, gs_command,
+                                                stderr=stderr)
+
         # 원본 및 최적화된 파일 크기 비교
-        original_size = os.path.getsize(input_file)
-        optimized_size = os.path.getsize(output_file)
-        
         reduction = 100 - (optimized_size / original_size * 100)
         
         print(f"✅ PDF 최적화 완료: {output_file}")
@@ -190,23 +195,35 @@ def main():
         print("선택된 PDF 파일이 없습니다.")
         return
     
-    # 각 PDF 파일을 처리
+    # 각 PDF 파일을 처리 - Ghostscript는 파일당 단일 스레드이므로
+    # 파일 단위로 동시에 실행하면 코어 수까지 거의 선형으로 빨라짐
     successful = 0
-    for pdf_file in pdf_files:
-        # 원본 파일 경로에서 새 파일 이름 생성 (파일명_optimized.pdf)
-        input_path = Path(pdf_file)
-        output_dir = input_path.parent
-        
-        # 파일 이름 정리: 특수문자를 제거하여 안전한 파일명 생성
-        sanitized_stem = sanitize_filename(input_path.stem)
-        output_name = f"{sanitized_stem}_optimized.pdf"
-        output_path = output_dir / output_name
-        
-        print(f"\n처리 중: {input_path}")
-        print(f"출력 파일: {output_path}")
-        
-        if optimize_pdf(str(input_path), str(output_path), gs_path):
-            successful += 1
+    jobs = min(os.cpu_count() or 1, len(pdf_files))
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {}
+        for pdf_file in pdf_files:
+            # 원본 파일 경로에서 새 파일 이름 생성 (파일명_optimized.pdf)
+            input_path = Path(pdf_file)
+            output_dir = input_path.parent
+
+            # 파일 이름 정리: 특수문자를 제거하여 안전한 파일명 생성
+            sanitized_stem = sanitize_filename(input_path.stem)
+            output_name = f"{sanitized_stem}_optimized.pdf"
+            output_path = output_dir / output_name
+
+            print(f"\n처리 중: {input_path}")
+            print(f"출력 파일: {output_path}")
+
+            futures[executor.submit(
+                optimize_pdf, str(input_path), str(output_path), gs_path)] = input_path
+
+        for future in as_completed(futures):
+            try:
+                if future.result():
+                    successful += 1
+            except Exception as e:
+                print(f"❌ {futures[future].name} 처리 중 오류 발생: {e}")
     
     # 결과 요약
     print(f"\n총 {len(pdf_files)}개의 PDF 중 {successful}개 최적화 완료")
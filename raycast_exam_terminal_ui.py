@@ -3,43 +3,59 @@
 import curses
 import time
 import json
+import pickle
 import random
+import re
 import os
 import subprocess
+import threading
 try:
     import pandas as pd
     PANDAS_AVAILABLE = True
 except ImportError:
     PANDAS_AVAILABLE = False
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+try:
+    import ijson  # 대용량 문제 은행을 스트리밍으로 읽기 위한 선택적 의존성
+except ImportError:
+    ijson = None
+try:
+    # 이모지/한글 혼합 문자열의 정확한 터미널 폭 계산용 선택적 의존성
+    from wcwidth import wcswidth as _wcswidth
+except ImportError:
+    _wcswidth = None
+
+_DEV_CATEGORIES = frozenset([
+    "개발 도구", "Extension 활용", "시스템 제어", "시스템 모니터링",
+    "시스템 관리", "시스템 디버깅", "시스템 분석", "시스템 최적화",
+    "네트워크 도구", "보안 도구", "보안 설정", "설정 관리",
+    "데이터 도구", "미디어 도구", "학습 도구", "AI 도구", "웹 도구"
+])
+
+_DEV_KEYWORDS = [
+    "extension", "api", "ssh", "docker", "git", "github", "xcode", "simulator",
+    "database", "sql", "json", "regex", "hash", "uuid", "base64", "csv",
+    "markdown", "code", "script", "terminal", "brew", "port", "dns",
+    "firewall", "cpu", "memory", "disk", "network", "ip", "url", "http"
+]
+
+# 키워드 목록을 하나의 정규식으로 합쳐 문제당 한 번의 C 레벨 탐색으로 처리
+# (기존처럼 부분 문자열 일치 - "github"의 "git" 등 - 를 유지하기 위해
+#  단어 경계 \b는 사용하지 않음)
+_DEV_KEYWORDS_RE = re.compile('|'.join(map(re.escape, _DEV_KEYWORDS)), re.IGNORECASE)
 
 def is_non_developer_friendly(question):
-    developer_categories = [
-        "개발 도구", "Extension 활용", "시스템 제어", "시스템 모니터링", 
-        "시스템 관리", "시스템 디버깅", "시스템 분석", "시스템 최적화",
-        "네트워크 도구", "보안 도구", "보안 설정", "설정 관리",
-        "데이터 도구", "미디어 도구", "학습 도구", "AI 도구", "웹 도구"
-    ]
-    
-    developer_keywords = [
-        "extension", "api", "ssh", "docker", "git", "github", "xcode", "simulator",
-        "database", "sql", "json", "regex", "hash", "uuid", "base64", "csv",
-        "markdown", "code", "script", "terminal", "brew", "port", "dns",
-        "firewall", "cpu", "memory", "disk", "network", "ip", "url", "http"
-    ]
-    
     # 카테고리 체크
-    if question.get('category', '') in developer_categories:
+    if question.get('category', '') in _DEV_CATEGORIES:
         return False
-    
-    # 제목과 설명에서 개발자 키워드 체크  
-    title = question.get('title', '').lower()
-    description = question.get('description', '').lower()
-    
-    for keyword in developer_keywords:
-        if keyword in title or keyword in description:
-            return False
-    
-    return True
+
+    # 제목과 설명에서 개발자 키워드 체크
+    text = question.get('title', '') + '\n' + question.get('description', '')
+    return _DEV_KEYWORDS_RE.search(text) is None
 
 def select_mode():
     """모드 선택 함수"""
@@ -71,7 +87,7 @@ def select_mode():
         
         while True:
             try:
-                stdscr.clear()
+                stdscr.erase()
                 h, w = stdscr.getmaxyx()
                 
                 # 터미널이 너무 작으면 경고 메시지
@@ -141,18 +157,71 @@ def select_mode():
     
     return curses.wrapper(mode_selection_screen)
 
+# 전역 random 모듈 대신 로컬 RNG 인스턴스 사용
+# RAYCAST_SEED 환경 변수를 주면 샘플링이 재현 가능해짐 (0/미설정이면 비결정적)
+_rng = random.Random(int(os.environ.get('RAYCAST_SEED', 0)) or None)
+
+def _sample_questions(all_questions, k=5):
+    """인덱스만 샘플링한 뒤 필요한 dict k개만 꺼냄"""
+    idxs = _rng.sample(range(len(all_questions)), min(k, len(all_questions)))
+    return [all_questions[i] for i in idxs]
+
+# 문제 은행 pickle 캐시 - xlsx/json 파싱(특히 openpyxl)은 수십~수백 ms지만
+# 캐시 적중 시 pickle.load 한 번으로 끝남. 원본 파일 mtime으로 무효화.
+_CACHE_PATH = 'questions.cache.pkl'
+_filter_memo = {}
+
+def _parse_question_bank(source_path):
+    """원본 파일(xlsx/json)을 파싱해 전체 문제 목록을 반환"""
+    if source_path.endswith('.xlsx'):
+        df = pd.read_excel(source_path, engine='openpyxl')
+        return df.to_dict('records')
+    with open(source_path, 'rb') as f:
+        if ijson is not None:
+            return list(ijson.items(f, 'raycast_questions.item'))
+        return _json_loads(f.read()).get('raycast_questions', [])
+
+def _load_question_bank(source_path):
+    """mtime 기반 pickle 캐시를 거쳐 전체 문제 목록을 로드"""
+    mtime = os.stat(source_path).st_mtime
+    try:
+        with open(_CACHE_PATH, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('path') == source_path and cached.get('mtime') == mtime:
+            return cached['questions']
+    except (OSError, pickle.PickleError, EOFError, KeyError, AttributeError):
+        pass
+
+    questions = _parse_question_bank(source_path)
+    try:
+        tmp_path = _CACHE_PATH + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'path': source_path, 'mtime': mtime, 'questions': questions},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError:
+        pass  # 캐시 저장 실패는 무시 (다음 실행 때 다시 파싱)
+    return questions
+
+def _filtered_questions(source_path, non_developer_mode):
+    """모드 필터까지 적용한 문제 목록 (프로세스 내 메모이즈)"""
+    key = (source_path, non_developer_mode)
+    if key not in _filter_memo:
+        bank = _load_question_bank(source_path)
+        if non_developer_mode:
+            bank = [q for q in bank if is_non_developer_friendly(q)]
+        _filter_memo[key] = bank
+    return _filter_memo[key]
+
 def load_questions(non_developer_mode=False):
     # 1. 엑셀 파일 우선 시도
     if PANDAS_AVAILABLE and os.path.exists('questions.xlsx'):
         try:
-            df = pd.read_excel('questions.xlsx', engine='openpyxl')
-            all_questions = df.to_dict('records')
-            if non_developer_mode:
-                all_questions = [q for q in all_questions if is_non_developer_friendly(q)]
+            all_questions = _filtered_questions('questions.xlsx', non_developer_mode)
             if len(all_questions) == 0:
                 print("⚠️  비개발자 모드에 적합한 문제가 엑셀 파일에 없습니다. JSON 파일을 시도합니다.")
             else:
-                selected_questions = random.sample(all_questions, min(5, len(all_questions)))
+                selected_questions = _sample_questions(all_questions)
                 print(f"✓ 엑셀 파일에서 {len(selected_questions)}개 문제를 로드했습니다.")
                 return selected_questions
         except Exception as e:
@@ -162,20 +231,16 @@ def load_questions(non_developer_mode=False):
     # 2. JSON 파일 시도
     if os.path.exists('questions.json'):
         try:
-            with open('questions.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                all_questions = data.get('raycast_questions', [])
-                if not all_questions:
-                    print("⚠️  JSON 파일에 'raycast_questions' 필드가 비어있거나 존재하지 않습니다.")
+            all_questions = _filtered_questions('questions.json', non_developer_mode)
+            if len(all_questions) == 0:
+                if non_developer_mode:
+                    print("⚠️  비개발자 모드에 적합한 문제가 JSON 파일에 없습니다. 기본 문제를 사용합니다.")
                 else:
-                    if non_developer_mode:
-                        all_questions = [q for q in all_questions if is_non_developer_friendly(q)]
-                    if len(all_questions) == 0:
-                        print("⚠️  비개발자 모드에 적합한 문제가 JSON 파일에 없습니다. 기본 문제를 사용합니다.")
-                    else:
-                        selected_questions = random.sample(all_questions, min(5, len(all_questions)))
-                        print(f"✓ JSON 파일에서 {len(selected_questions)}개 문제를 로드했습니다.")
-                        return selected_questions
+                    print("⚠️  JSON 파일에 'raycast_questions' 필드가 비어있거나 존재하지 않습니다.")
+            else:
+                selected_questions = _sample_questions(all_questions)
+                print(f"✓ JSON 파일에서 {len(selected_questions)}개 문제를 로드했습니다.")
+                return selected_questions
         except json.JSONDecodeError as e:
             print(f"⚠️  JSON 파일 파싱 오류: {e}")
             print("파일의 JSON 형식을 확인해주세요.")
@@ -271,6 +336,10 @@ def safe_clrtoeol(stdscr):
 
 def get_display_width(text):
     """한글과 영문을 고려한 실제 표시 폭 계산"""
+    if _wcswidth is not None:
+        width = _wcswidth(text)
+        if width >= 0:  # 제어 문자가 섞이면 -1이 반환됨
+            return width
     width = 0
     for char in text:
         if ord(char) > 0x1100:  # 한글 및 기타 전각 문자
@@ -294,11 +363,15 @@ def truncate_text(text, max_width):
         current_width += char_width
     return truncated
 
-def draw_centered(stdscr, text, y_offset=0, attr=0):
-    try:
-        h, w = stdscr.getmaxyx()
-    except curses.error:
-        return  # 터미널 정보를 가져올 수 없으면 반환
+def draw_centered(stdscr, text, y_offset=0, attr=0, hw=None):
+    # 호출자가 프레임 시작에 구한 (h, w)를 넘기면 프레임당 getmaxyx 1회로 충분
+    if hw is not None:
+        h, w = hw
+    else:
+        try:
+            h, w = stdscr.getmaxyx()
+        except curses.error:
+            return  # 터미널 정보를 가져올 수 없으면 반환
     
     # 터미널이 너무 작으면 그려지지 않음
     if h < 10 or w < 20:
@@ -324,7 +397,12 @@ def draw_centered(stdscr, text, y_offset=0, attr=0):
     except curses.error:
         return False  # 화면 경계를 벗어나면 무시
 
+# 시험 시간은 5분으로 고정이므로 가능한 301개의 MM:SS 문자열을 미리 포맷
+_MMSS = [f"{s // 60:02d}:{s % 60:02d}" for s in range(5 * 60 + 1)]
+
 def format_time(seconds):
+    if 0 <= seconds <= 300:
+        return _MMSS[seconds]
     minutes = seconds // 60
     seconds = seconds % 60
     return f"{minutes:02d}:{seconds:02d}"
@@ -346,8 +424,11 @@ def trigger_confetti():
         except:
             pass
         
-        # Raycast confetti 트리거
-        subprocess.run(['open', 'raycast://confetti'], check=False)
+        # Raycast confetti 트리거 - 완료를 기다리지 않고 바로 반환
+        subprocess.Popen(['open', 'raycast://confetti'],
+                         stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL,
+                         start_new_session=True)
         
         # 약간의 지연 후 원래 앱으로 포커스 복원
         time.sleep(0.5)  # confetti 효과가 시작될 시간 확보
@@ -422,7 +503,7 @@ def run_exam():
         questions = load_questions(non_developer_mode)
         
         if not questions:
-            stdscr.clear()
+            stdscr.erase()
             safe_addstr(stdscr, h//2-1, 2, "❌ 선택한 모드에 적합한 문제가 없습니다!", curses.A_BOLD)
             safe_addstr(stdscr, h//2, 2, "비개발자 모드에서 일반 모드로 전환하거나")
             safe_addstr(stdscr, h//2+1, 2, "questions.json 또는 questions.xlsx 파일을 추가해주세요.")
@@ -458,17 +539,36 @@ def run_exam():
         except curses.error:
             return  # 타이틀 화면에서 오류 발생 시 종료
 
+        # 각 줄의 정적 부분은 한 번만 포맷해 두고, 다시 그릴 때는
+        # prefix/완료시간만 이어 붙임 (dict 조회와 f-string 포맷 비용 제거)
+        static_lines = [
+            f"{i+1}. {q['title']} [{q['difficulty']}] ({q['estimated_time']}) - {q['category']}"
+            for i, q in enumerate(questions)
+        ]
+        description_lines = ['    ' + str(q['description']) for q in questions]
+
         current_idx = 0
         completed = [False]*len(questions)
         completion_times = [0]*len(questions)
         start_time = time.time()
         exam_duration = 5 * 60
-        last_remaining_time = -1
-        last_completed_count = -1
-        last_current_idx = -1
+        mode_text = "비개발자 모드" if non_developer_mode else "일반 모드"
         need_full_redraw = True
+        last_hw = None
+        # 렌더된 헤더 문자열 캐시 - 바뀐 줄만 다시 씀
+        prev_header = [None] * 4
+
+        # 문제 리스트는 pad에 그려 두고 보이는 영역만 블릿 - 문제 수가
+        # 화면보다 많아도 잘리지 않고 스크롤됨
+        pad = None
+        pad_w = 0
+        pad_dirty = True
+        scroll = 0
+        LIST_TOP, LIST_LEFT = 6, 4
 
-        stdscr.nodelay(True)
+        # getch가 키 입력 또는 1초 타임아웃까지 블록하므로 틱당 sleep 없이
+        # 초당 1회만 다시 그림 (키 입력 시에는 즉시 깨어남)
+        stdscr.timeout(1000)
 
         while True:
             try:
@@ -476,7 +576,7 @@ def run_exam():
                 
                 # 터미널 크기가 다시 너무 작아진 경우 처리
                 if h < 15 or w < 50:
-                    stdscr.clear()
+                    stdscr.erase()
                     safe_addstr(stdscr, max(0, h//2), max(0, w//2-15), "터미널을 더 크게 해주세요")
                     stdscr.refresh()
                     time.sleep(0.5)
@@ -486,118 +586,121 @@ def run_exam():
                 break  # 터미널 정보를 가져올 수 없으면 종료
             
             # 초기화 또는 터미널 크기 변경 시에만 전체 다시 그리기
+            if (h, w) != last_hw:
+                last_hw = (h, w)
+                need_full_redraw = True
             if need_full_redraw:
                 try:
-                    stdscr.clear()
-                    need_full_redraw = False
+                    stdscr.erase()
                 except curses.error:
                     break
+                prev_header = [None] * 4
+                pad_dirty = True
+                need_full_redraw = False
 
             elapsed_time = time.time() - start_time
             remaining_time = max(0, exam_duration - elapsed_time)
             completed_count = sum(completed)
-            
+
             if remaining_time <= 0:
                 break
 
-            # 헤더 업데이트 (시간이나 진행상황이 변경되었을 때만)
-            if int(remaining_time) != last_remaining_time or completed_count != last_completed_count or need_full_redraw:
-                mode_text = "비개발자 모드" if non_developer_mode else "일반 모드"
-                
-                # 헤더 영역만 선택적으로 지우기 - 문제 영역은 보호
-                # 헤더는 상단 5줄만 지우기 (y=0~4)
-                for i in range(5):
-                    if i >= 0 and i < h and i < 6:  # 문제 시작 지점(y=6) 전까지만
-                        try:
-                            stdscr.move(i, 0)
-                            stdscr.clrtoeol()
-                        except curses.error:
-                            pass
-                
-                # 헤더 정보를 상단 고정 위치에 표시
+            # 헤더 업데이트 - 렌더된 문자열을 이전 값과 비교해 바뀐 줄만 다시 씀
+            time_color = curses.A_BLINK if remaining_time <= 60 else curses.A_NORMAL
+            header_lines = [
+                (f"⚡ Raycast 실기시험 ({mode_text})", curses.A_BOLD),
+                (f"남은 시간: {format_time(int(remaining_time))}", time_color),
+                (f"진행 상황: {completed_count} / {len(questions)}", curses.A_NORMAL),
+                ("─" * min(50, w - 4), curses.A_NORMAL),  # 구분선
+            ]
+            for i, (line, attr) in enumerate(header_lines):
+                if prev_header[i] != line:
+                    try:
+                        stdscr.move(i, 0)
+                        stdscr.clrtoeol()
+                        stdscr.addnstr(i, 2, line, max(1, w - 3), attr)
+                    except curses.error:
+                        pass  # 화면 경계 오류 무시
+                    prev_header[i] = line
+
+            # 터미널 폭이 바뀌면 pad를 다시 만듦
+            if pad is None or pad_w != w:
                 try:
-                    stdscr.addstr(0, 2, f"⚡ Raycast 실기시험 ({mode_text})", curses.A_BOLD)
-                    
-                    time_color = curses.A_NORMAL
-                    if remaining_time <= 60:
-                        time_color = curses.A_BLINK
-                    
-                    time_text = f"남은 시간: {format_time(int(remaining_time))}"
-                    progress_text = f"진행 상황: {completed_count} / {len(questions)}"
-                    
-                    stdscr.addstr(1, 2, time_text, time_color)
-                    stdscr.addstr(2, 2, progress_text)
-                    stdscr.addstr(3, 2, "─" * min(50, w-4))  # 구분선
+                    pad = curses.newpad(len(questions) * 3 + 2, max(w, 2))
                 except curses.error:
-                    pass  # 화면 경계 오류 무시
-                
-                last_remaining_time = int(remaining_time)
-                last_completed_count = completed_count
+                    pad = None
+                pad_w = w
+                pad_dirty = True
 
-            # 문제 리스트 업데이트 (현재 선택이나 완료 상태가 변경되었을 때만)
-            if current_idx != last_current_idx or completed_count != last_completed_count or need_full_redraw:
-                for idx, q in enumerate(questions):
+            # 문제 리스트 업데이트 (선택이나 완료 상태가 변경되었을 때만)
+            if pad is not None and pad_dirty:
+                pad.erase()
+                for idx in range(len(questions)):
                     prefix = "[✓] " if completed[idx] else "[ ] "
                     time_suffix = ""
                     if completed[idx]:
                         time_suffix = f" ({format_time(int(completion_times[idx]))})"
-                    
-                    # 화면 크기 확인
-                    if h < 20:  # 터미널이 너무 작으면 스킵
-                        continue
-                        
-                    # 첫 번째 줄: title, difficulty, estimated_time, category
-                    title_line = f"{prefix}{idx+1}. {q['title']} [{q['difficulty']}] ({q['estimated_time']}) - {q['category']}{time_suffix}"
-                    # 두 번째 줄: description
-                    description_line = f"    {q['description']}"
-                    
+
+                    # 정적 부분에 상태 prefix/완료시간만 이어 붙임
+                    title_line = prefix + static_lines[idx] + time_suffix
+                    description_line = description_lines[idx]
+
                     # 텍스트 길이 제한
                     max_line_width = w - 8  # 좌우 여백
                     title_line = truncate_text(title_line, max_line_width)
                     description_line = truncate_text(description_line, max_line_width)
-                    
-                    y_pos = 6 + idx * 3  # 각 문제마다 3줄 간격
-                    
-                    # 화면을 벗어나면 표시하지 않음
-                    if y_pos >= h - 2:
-                        break
-                    
-                    if idx == current_idx:
-                        safe_addstr(stdscr, y_pos, 4, title_line, curses.A_REVERSE)
-                        if y_pos + 1 < h - 1:
-                            safe_addstr(stdscr, y_pos + 1, 4, description_line, curses.A_DIM)
-                    else:
-                        safe_addstr(stdscr, y_pos, 4, title_line)
-                        if y_pos + 1 < h - 1:
-                            safe_addstr(stdscr, y_pos + 1, 4, description_line, curses.A_DIM)
-                
-                last_current_idx = current_idx
 
+                    y_pos = idx * 3  # 각 문제마다 3줄 간격 (pad 내부 좌표)
+                    attr = curses.A_REVERSE if idx == current_idx else curses.A_NORMAL
+                    try:
+                        pad.addstr(y_pos, 0, title_line, attr)
+                        pad.addstr(y_pos + 1, 0, description_line, curses.A_DIM)
+                    except curses.error:
+                        pass
+
+                pad_dirty = False
+
+            # 선택 항목이 보이는 영역에 들어오도록 스크롤 조정
+            visible_rows = max(1, (h - 2) - LIST_TOP)
+            sel_row = current_idx * 3
+            if sel_row < scroll:
+                scroll = sel_row
+            elif sel_row + 1 >= scroll + visible_rows:
+                scroll = sel_row + 2 - visible_rows
+
+            # 부분 갱신을 모아 한 번에 화면으로 내보냄
             try:
-                key = stdscr.getch()
-            except:
-                key = -1
+                stdscr.noutrefresh()
+                if pad is not None:
+                    pad.noutrefresh(scroll, 0, LIST_TOP, LIST_LEFT, h - 2, w - 2)
+                curses.doupdate()
+            except curses.error:
+                pass
+
+            # timeout 모드에서는 입력이 없으면 getch가 -1을 반환하므로
+            # 별도의 예외 처리가 필요 없음
+            key = stdscr.getch()
 
             if key == curses.KEY_UP:
                 current_idx = (current_idx - 1) % len(questions)
+                pad_dirty = True
             elif key == curses.KEY_DOWN:
                 current_idx = (current_idx + 1) % len(questions)
+                pad_dirty = True
             elif key == ord('q') or key == ord('Q'):
                 break
             elif key == ord('\n') or key == 10:
                 if not completed[current_idx]:
                     completed[current_idx] = True
                     completion_times[current_idx] = time.time() - start_time
+                    pad_dirty = True
                     if all(completed):
                         break
                     current_idx = (current_idx + 1) % len(questions)
 
-            stdscr.refresh()
-            time.sleep(0.05)  # 반응성 개선을 위해 단축
-
-        # 종료 메시지
+        # 종료 메시지 - erase로 비우면 curses가 바뀐 셀만 전송함
         try:
-            stdscr.clear()
+            stdscr.erase()
             stdscr.nodelay(False)
         except curses.error:
             pass  # 종료 시 오류 무시
@@ -615,8 +718,9 @@ def run_exam():
                 safe_addstr(stdscr, result_y, 2, "⏰ 시간이 종료되었습니다!", curses.A_BOLD)
             elif all_completed:
                 safe_addstr(stdscr, result_y, 2, "🎉 축하합니다! 모든 문제를 완료했습니다!", curses.A_BOLD)
-                # Confetti 실행
-                trigger_confetti()
+                # Confetti는 백그라운드에서 실행 - 포커스 복원의 0.5초 대기가
+                # 결과 화면 표시를 막지 않음
+                threading.Thread(target=trigger_confetti, daemon=True).start()
             else:
                 safe_addstr(stdscr, result_y, 2, "✅ 실기시험을 종료합니다!", curses.A_BOLD)
             
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+외부 도구(ffmpeg, gs 등) 경로를 찾고 캐시하는 공용 헬퍼
+특징: shutil.which 탐색 결과를 ~/.cache/raycast_scripts/tools.json에
+저장하여 핫키로 실행되는 스크립트의 시작 비용을 줄입니다.
+캐시는 $PATH 해시를 키로 사용하므로 PATH가 바뀌면 자동으로 다시 탐색합니다.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+_CACHE_DIR = os.path.expanduser('~/.cache/raycast_scripts')
+_CACHE_FILE = os.path.join(_CACHE_DIR, 'tools.json')
+
+
+def _path_key():
+    """현재 $PATH의 짧은 해시를 반환합니다."""
+    return hashlib.blake2s(
+        os.environ.get('PATH', '').encode(), digest_size=8).hexdigest()
+
+
+def _load_cache():
+    try:
+        with open(_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache):
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass  # 캐시 저장 실패는 무시 (다음 실행 때 다시 탐색)
+
+
+def cached_which(name, candidates=None):
+    """
+    도구 실행 파일의 경로를 찾습니다. 이전에 찾은 경로는 캐시에서 재사용합니다.
+
+    Args:
+        name (str): 도구 이름 (캐시 키로 사용)
+        candidates (list): 확인할 경로/이름 후보 목록 (기본값: [name])
+
+    Returns:
+        str: 실행 파일 경로 또는 찾지 못한 경우 None
+    """
+    key = _path_key()
+    cache = _load_cache()
+    entry = cache.get(name)
+
+    # 캐시 적중: PATH가 같고 경로가 아직 존재하면 stat 한 번으로 끝
+    if entry and entry.get('path_key') == key and os.path.exists(entry.get('path', '')):
+        return entry['path']
+
+    # 캐시 미스: 후보를 순서대로 탐색
+    for candidate in (candidates or [name]):
+        resolved = shutil.which(candidate)
+        if resolved:
+            cache[name] = {'path_key': key, 'path': resolved}
+            _save_cache(cache)
+            return resolved
+
+    return None
@@ -1,62 +1,138 @@
 import sys
 import termios
+import threading
 import time
 import tty
 import random
 import subprocess
+import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
-def read_char():
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
+
+# tldr 설명 캐시 - 설치된 tldr 버전을 키로 사용해
+# 다음 실행부터는 subprocess 없이 dict 조회로 끝남
+_TLDR_CACHE_PATH = os.path.expanduser('~/.cache/raycast_typing_tldr.json')
+_tldr_cache = None  # {'version': str, 'descriptions': {base: desc}}
+# 워밍 스레드와 메인 스레드가 descriptions를 동시에 만지므로 직렬화·수정은
+# 이 락 아래에서만 수행한다
+_tldr_lock = threading.Lock()
+
+def _base_command(command):
+    """명령어 문자열에서 실제 기본 명령어를 추출 (sudo/nohup 처리)"""
+    parts = command.split()
+    if not parts:
+        return command
+    base = parts[0]
+    if base in ('sudo', 'nohup') and len(parts) > 1:
+        base = parts[1]
+    return base
+
+def _tldr_version():
     try:
-        tty.setraw(sys.stdin.fileno())
-        char = sys.stdin.read(1)
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    return char
+        result = subprocess.run(['tldr', '--version'],
+                                capture_output=True, text=True, timeout=5)
+        return result.stdout.strip() or 'unknown'
+    except Exception:
+        return None
+
+def _load_tldr_cache():
+    global _tldr_cache
+    if _tldr_cache is not None:
+        return _tldr_cache
+    version = _tldr_version()
+    try:
+        with open(_TLDR_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if version is not None and cached.get('version') == version:
+            _tldr_cache = cached
+            return _tldr_cache
+    except (OSError, ValueError):
+        pass
+    _tldr_cache = {'version': version, 'descriptions': {}}
+    return _tldr_cache
+
+def _save_tldr_cache():
+    # 락 안에서 문자열로 직렬화를 끝낸다 - json.dump가 순회하는 도중 다른
+    # 스레드가 descriptions를 키우면 RuntimeError가 난다
+    with _tldr_lock:
+        data = json.dumps(_tldr_cache, ensure_ascii=False)
+    try:
+        os.makedirs(os.path.dirname(_TLDR_CACHE_PATH), exist_ok=True)
+        with open(_TLDR_CACHE_PATH, 'w', encoding='utf-8') as f:
+            f.write(data)
+    except OSError:
+        pass  # 캐시 저장 실패는 무시
+
+def _fetch_tldr_description(base_command):
+    """tldr를 실행해 첫 번째 설명 줄을 파싱 (실패 시 None)"""
+    result = subprocess.run(
+        ['tldr', base_command],
+        capture_output=True,
+        text=True,
+        timeout=5
+    )
+
+    if result.returncode == 0:
+        lines = result.stdout.strip().split('\n')
+        # 두 번째 줄이 보통 설명 (첫 번째 줄은 명령어 이름)
+        if len(lines) >= 2:
+            description_line = lines[1].strip()
+            # 빈 줄이 아닌 경우 반환
+            if description_line:
+                return description_line
+
+        # 두 번째 줄이 비어있거나 없으면 세 번째 줄부터 찾기
+        for line in lines[2:]:
+            line = line.strip()
+            if line and not line.startswith('-') and not line.startswith('More information'):
+                return line
+
+        return f"'{base_command}' 명령어 설명"
+    return f"'{base_command}' 명령어에 대한 설명을 찾을 수 없습니다."
+
+def warm_tldr_cache(commands):
+    """history의 기본 명령어들에 대한 tldr 설명을 병렬로 미리 수집"""
+    cache = _load_tldr_cache()
+    if cache['version'] is None:  # tldr 미설치 - 캐시 무의미
+        return
+    descriptions = cache['descriptions']
+    missing = sorted({_base_command(c) for c in commands} - descriptions.keys())
+    if not missing:
+        return
+
+    def fetch(base):
+        try:
+            return base, _fetch_tldr_description(base)
+        except Exception:
+            return base, None
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for base, desc in executor.map(fetch, missing):
+            if desc is not None:
+                with _tldr_lock:
+                    descriptions[base] = desc
+    _save_tldr_cache()
 
 def get_tldr_description(command):
     """tldr 명령어를 사용하여 명령어 설명을 가져오는 함수 (첫 번째 설명 줄만)"""
     try:
-        # 명령어에서 첫 번째 단어만 추출 (파이프나 옵션 제거)
-        base_command = command.split()[0] if command.split() else command
-        
-        # 특수문자 제거 (sudo, &&, || 등 처리)
-        if base_command in ['sudo', 'nohup']:
-            # sudo나 nohup 다음의 실제 명령어 찾기
-            parts = command.split()
-            if len(parts) > 1:
-                base_command = parts[1]
-        
-        # tldr 명령어 실행
-        result = subprocess.run(
-            ['tldr', base_command], 
-            capture_output=True, 
-            text=True, 
-            timeout=5
-        )
-        
-        if result.returncode == 0:
-            lines = result.stdout.strip().split('\n')
-            # 두 번째 줄이 보통 설명 (첫 번째 줄은 명령어 이름)
-            if len(lines) >= 2:
-                description_line = lines[1].strip()
-                # 빈 줄이 아닌 경우 반환
-                if description_line:
-                    return description_line
-            
-            # 두 번째 줄이 비어있거나 없으면 세 번째 줄부터 찾기
-            for line in lines[2:]:
-                line = line.strip()
-                if line and not line.startswith('-') and not line.startswith('More information'):
-                    return line
-                    
-            return f"'{base_command}' 명령어 설명"
-        else:
-            return f"'{base_command}' 명령어에 대한 설명을 찾을 수 없습니다."
-            
+        base_command = _base_command(command)
+
+        # 캐시 적중 시 subprocess 없이 바로 반환
+        cache = _load_tldr_cache()
+        with _tldr_lock:
+            cached = cache['descriptions'].get(base_command)
+        if cached is not None:
+            return cached
+
+        description = _fetch_tldr_description(base_command)
+        with _tldr_lock:
+            cache['descriptions'][base_command] = description
+        _save_tldr_cache()
+        return description
+
     except subprocess.TimeoutExpired:
         return "tldr 명령어 실행 시간 초과"
     except FileNotFoundError:
@@ -64,47 +140,69 @@ def get_tldr_description(command):
     except Exception as e:
         return f"tldr 실행 중 오류: {e}"
 
+# history 명령어의 번호 형식: "  123  ls -la"
+_HIST_NUM_RE = re.compile(r'^\d+\s+(.*)$')
+
+def _filter_commands(lines, limit=500):
+    """history 줄들을 정제하고 중복 없이 수집 (한 줄씩 스트리밍 처리)
+
+    main()은 결국 한 명령어만 고르므로 limit개를 모으면 바로 중단 -
+    수십만 줄짜리 history 파일도 앞부분만 읽고 끝남
+    """
+    seen = set()
+    commands = []
+    for raw in lines:
+        if len(commands) >= limit:
+            break
+        cmd = raw.strip()
+
+        # fish history 형식("- cmd: command" / "  when: ts") 처리
+        if cmd.startswith('- cmd: '):
+            cmd = cmd[7:]
+        elif cmd.startswith('when: '):
+            continue
+
+        # zsh history 형식(": 1587750465:0;command")에서 타임스탬프 제거
+        # 첫 ';' 뒤가 항상 명령어 본문이므로 정규식 대신 find 한 번이면 충분
+        if cmd.startswith(': '):
+            semi = cmd.find(';')
+            if semi != -1:
+                cmd = cmd[semi + 1:]
+        # history 명령어의 번호 제거
+        elif cmd:
+            match = _HIST_NUM_RE.match(cmd)
+            if match:
+                cmd = match.group(1)
+
+        # 적절한 길이의 명령어만 선택, 중복은 set으로 O(1) 판별
+        if 10 <= len(cmd) <= 80 and cmd not in seen:
+            seen.add(cmd)
+            commands.append(cmd)
+    return commands
+
+# 직접 읽을 history 파일 후보들 - 'history'를 서브셸에서 실행하는 방식은
+# 셸별 히스토리가 로드되지 않아 대부분 빈 출력만 반환함
+_HIST_CANDIDATES = (
+    '~/.zsh_history',
+    '~/.bash_history',
+    '~/.histfile',
+    '~/.local/share/fish/fish_history',
+)
+
 def get_shell_history():
     """shell history에서 명령어들을 가져오는 함수"""
     try:
-        # zsh history 파일 경로
-        history_file = os.path.expanduser("~/.zsh_history")
-        
-        # history 파일이 존재하는지 확인
-        if os.path.exists(history_file):
-            with open(history_file, 'r', encoding='utf-8', errors='ignore') as f:
-                commands = f.readlines()
-        else:
-            # history 명령어를 직접 실행
-            result = subprocess.run(['history'], shell=True, capture_output=True, text=True)
-            commands = result.stdout.split('\n')
-        
-        # 빈 줄과 중복 제거, 적절한 길이의 명령어만 선택
-        filtered_commands = []
-        for cmd in commands:
-            cmd = cmd.strip()
-            
-            # zsh history 형식에서 타임스탬프 제거
-            # 형식: ": 1587750465:0;command" -> "command"
-            if cmd.startswith(': '):
-                # 정규식을 사용하여 타임스탬프 패턴 제거
-                match = re.match(r'^: \d+:\d+;(.*)$', cmd)
-                if match:
-                    cmd = match.group(1)
-            
-            # history 명령어의 번호 제거 (예: "  123  ls -la" -> "ls -la")
-            elif cmd and len(cmd.split()) > 1 and cmd.split()[0].isdigit():
-                cmd = ' '.join(cmd.split()[1:])
-            
-            # 적절한 길이의 명령어만 선택
-            if cmd and 10 <= len(cmd) <= 80:
-                filtered_commands.append(cmd)
-        
-        # 중복 제거
-        unique_commands = list(dict.fromkeys(filtered_commands))
-        
-        return unique_commands if unique_commands else get_fallback_commands()
-        
+        # 먼저 발견되는 history 파일을 한 줄씩 스트리밍 처리
+        for candidate in _HIST_CANDIDATES:
+            history_file = os.path.expanduser(candidate)
+            if os.path.exists(history_file):
+                with open(history_file, 'r', encoding='utf-8', errors='ignore') as f:
+                    unique_commands = _filter_commands(f)
+                if unique_commands:
+                    return unique_commands
+
+        return get_fallback_commands()
+
     except Exception as e:
         print(f"History를 읽는 중 오류 발생: {e}")
         return get_fallback_commands()
@@ -125,35 +223,52 @@ def get_fallback_commands():
     ]
 
 def typed_vs_expected(text):
-    for expected in text:
-        typed = read_char()
-        yield (typed, expected)
+    # raw 모드는 display_typed가 세션 전체에 대해 한 번만 설정함
+    if text.isascii():
+        # shell 명령어는 사실상 항상 ASCII - 바이트로 읽고 latin-1로
+        # 변환해 파이썬의 증분 UTF-8 디코더를 우회
+        read = sys.stdin.buffer.read
+        for expected in text:
+            yield read(1).decode('latin-1'), expected
+    else:
+        read = sys.stdin.read
+        for expected in text:
+            yield read(1), expected
 
-def color_char(typed, expected):
-    color = '\033[92m' if typed == expected else '\033[91m'
-    return f'{color}{typed}\033[0m'
+# ANSI 색상 코드 - print 대신 os.write로 내보내기 위한 바이트 상수
+_GREEN = b'\x1b[92m'
+_RED = b'\x1b[91m'
+_RESET = b'\x1b[0m'
 
-def typing_speed(text, start_time, end_time):
-    characters = len(text)  # 글자 수로 계산
-    minutes = (end_time - start_time) / 60
-    return characters / minutes if minutes > 0 else 0
+def typing_speed(char_count, elapsed_seconds):
+    minutes = elapsed_seconds / 60
+    return char_count / minutes if minutes > 0 else 0
 
 def display_typed(text):
     start_time = time.time()
-    typed_list = []
-    for typed, expected in typed_vs_expected(text):
-        colored_char = color_char(typed, expected)
-        print(colored_char, end='', flush=True)
-        typed_list.append((typed, expected))
-    end_time = time.time()
-    elapsed_time = end_time - start_time
-    return elapsed_time, typed_list
-
-def accuracy(typed_list):
-    if not typed_list:
-        return 0
-    correct = sum(1 for typed, expected in typed_list if typed == expected)
-    return correct / len(typed_list) * 100
+    # 결과 집계는 카운터 두 개로 충분 - (typed, expected) 튜플 리스트를
+    # 만들었다가 다시 순회하는 비용을 없앰
+    correct = 0
+    total = 0
+    # 키 입력마다 tcgetattr/tcsetattr를 반복하지 않고
+    # 세션 시작 시 한 번만 raw 모드로 전환 (글자당 ioctl 2회 제거)
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        for typed, expected in typed_vs_expected(text):
+            matched = typed == expected
+            # 글자당 print+flush(쓰기 syscall + 락) 대신 os.write 한 번
+            os.write(1, (_GREEN if matched else _RED) + typed.encode('utf-8') + _RESET)
+            correct += matched
+            total += 1
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    elapsed_time = time.time() - start_time
+    return elapsed_time, correct, total
+
+def accuracy(correct, total):
+    return correct / total * 100 if total else 0
 
 def main():
     print("Shell History Typing Practice")
@@ -168,7 +283,11 @@ def main():
     
     # 랜덤하게 명령어 선택
     selected_command = random.choice(commands)
-    
+
+    # history의 나머지 명령어 설명은 백그라운드에서 미리 수집해 두어
+    # 다음 실행부터는 캐시 조회만으로 즉시 표시됨
+    threading.Thread(target=warm_tldr_cache, args=(commands,), daemon=True).start()
+
     # tldr 설명 가져오기
     print("명령어 설명을 가져오는 중...")
     description = get_tldr_description(selected_command)
@@ -182,9 +301,9 @@ def main():
     print()
     print("타이핑을 시작하세요:")
     
-    elapsed_time, typed_list = display_typed(selected_command)
-    speed = typing_speed(selected_command, 0, elapsed_time)
-    acc = accuracy(typed_list)
+    elapsed_time, correct, total = display_typed(selected_command)
+    speed = typing_speed(total, elapsed_time)
+    acc = accuracy(correct, total)
     
     print(f"\n\n결과:")
     print(f"타이핑 속도: {speed:.2f} 글자/분")